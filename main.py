@@ -1,8 +1,8 @@
 import sys
 import json
 import os
+import argparse
 import keyboard
-from collections import defaultdict
 from functools import partial
 
 import pygame
@@ -20,21 +20,38 @@ from PyQt6.QtWidgets import (
     QMessageBox,
     QScrollArea,
     QGridLayout,
+    QFileDialog,
 )
 from PyQt6.QtGui import QIcon, QAction, QFont, QFontDatabase
 from PyQt6.QtCore import Qt, QDateTime, QTimer, QObject, pyqtSignal
 
 from timer import TimerManager
+from overlay_feed import OverlayFeed
+from tray_icon import CountdownIconAtlas, countdown_text
 from singleton import SingleInstance
+from profiler import SessionProfiler
+from timer_store import (
+    BulkImportError,
+    export_timers,
+    import_timers,
+    load_timers,
+    merge_entries,
+    read_entries,
+    save_timers,
+)
 
 
 TIMER_FILE = "timers.json"
+LOCK_FILE = os.path.join(os.path.expanduser("~"), ".compact_timer.lock")
+TRAY_TOOLTIP = "트레이 타이머"
 CONF_FILE = "conf.json"
 ICON_FILE = ""
 FONT_FILE = ""
 FONT_SIZE = 9
 ALERT_SOUND_FILE = ""
 ALERT_VOLUME = 0.5
+PROFILE_DIR = "profiles"
+FEED_PORT = 0
 
 with open(CONF_FILE, "r", encoding="utf-8") as f:
     json_data = json.load(f)
@@ -43,6 +60,8 @@ with open(CONF_FILE, "r", encoding="utf-8") as f:
     FONT_SIZE = json_data.get("font_size", 9)
     ALERT_SOUND_FILE = json_data.get("alert_sound_file", "")
     ALERT_VOLUME = json_data.get("alert_volume", 0.5)
+    PROFILE_DIR = json_data.get("profile_dir", "profiles")
+    FEED_PORT = json_data.get("feed_port", 0)
 
 
 class TrayApp:
@@ -52,8 +71,15 @@ class TrayApp:
         self.timer_manager = TimerManager()
         self.timer_manager.timer_finished.connect(self.on_timer_finished)
         self.hotkey_list = []
+        self.group_menus = []
+        self.alerts = set()  # 화면에 떠 있는 FloatingAlert
+        self.timer_window = None
+        self.grid = None
+        self.timer_labels = {}  # (group, title): 남은 시간 QLabel
+        self.timer_rows = {}  # (group, title): 해당 행의 위젯 목록
         self.hotkey_bridge = HotkeyBridge()
         self.hotkey_bridge.hotkey_triggered.connect(self.on_hotkey_triggered)
+        self.profiler = SessionProfiler(PROFILE_DIR)
 
         # 숨겨진 루트 위젯 (필수: 이벤트 루프 안정화)
         self.root = QWidget()
@@ -63,15 +89,35 @@ class TrayApp:
         self.tray = QSystemTrayIcon()
         self.icon = QIcon(ICON_FILE)
         self.tray.setIcon(self.icon)
-        self.tray.setToolTip("트레이 타이머")
+        self.tray.setToolTip(TRAY_TOOLTIP)
         self.tray.setVisible(True)
 
+        # 트레이 아이콘 / 툴팁 카운트다운 (실행 중인 타이머가 있을 때만 동작)
+        self.tray_atlas = CountdownIconAtlas(self.icon)
+        self.tray_state = (None, TRAY_TOOLTIP)
+        self.tray_timer = QTimer(self.root)
+        self.tray_timer.setInterval(1000)
+        self.tray_timer.timeout.connect(self.update_tray_countdown)
+        self.timer_manager.timer_started.connect(self.update_tray_countdown)
+        self.timer_manager.timer_finished.connect(self.update_tray_countdown)
+        self.timer_manager.timer_stopped.connect(self.update_tray_countdown)
+
+        # 방송 오버레이용 localhost 피드 (feed_port 가 0 이면 사용 안 함)
+        self.feed = None
+        if FEED_PORT:
+            try:
+                self.feed = OverlayFeed(self.timer_manager, FEED_PORT)
+                self.feed.start()
+            except OSError as e:
+                print(f"[피드 오류] {e}")
+                self.feed = None
+
         # 트레이 클릭 이벤트 추가
         self.tray.activated.connect(self.on_tray_activated)
-        self.refresh_timer = QTimer()
+        # 타이머 창 갱신용 QTimer 는 하나만 만들어 창이 열릴 때만 돌린다
+        self.refresh_timer = QTimer(self.root)
         self.refresh_timer.setInterval(1000)  # 1초마다 갱신
         self.refresh_timer.timeout.connect(self.update_timer_window)
-        self.refresh_timer.stop()
 
         # 메뉴 구성
         self.menu = QMenu(self.root)
@@ -96,10 +142,26 @@ class TrayApp:
         self.action_delete_timer.triggered.connect(self.show_delete_dialog)
         self.menu.addAction(self.action_delete_timer)
 
+        self.action_import_timers = QAction("📥 타이머 가져오기", self.menu)
+        self.action_import_timers.triggered.connect(self.show_import_dialog)
+        self.menu.addAction(self.action_import_timers)
+
+        self.action_export_timers = QAction("📤 타이머 내보내기", self.menu)
+        self.action_export_timers.triggered.connect(self.show_export_dialog)
+        self.menu.addAction(self.action_export_timers)
+
         self.menu.addSeparator()
 
+        self.action_profile = QAction("🩺 프로파일링 시작", self.menu)
+        self.action_profile.setCheckable(True)
+        self.action_profile.toggled.connect(self.toggle_profiling)
+        self.menu.addAction(self.action_profile)
+
         self.action_quit = QAction("❌ 종료", self.menu)
         self.action_quit.triggered.connect(self.app.quit)
+        self.app.aboutToQuit.connect(self.profiler.stop)
+        if self.feed:
+            self.app.aboutToQuit.connect(self.feed.stop)
         self.menu.addAction(self.action_quit)
 
         self.tray.setContextMenu(self.menu)
@@ -108,18 +170,22 @@ class TrayApp:
         self.app.exec()
 
     # 메뉴 빌드
-    def build_timer_menu(self):
+    def build_timer_menu(self, all_data=None):
         self.action_saved_timer_menu.clear()
+        # clear() 는 하위 QMenu 자체는 지우지 않으므로 직접 정리
+        for group_menu in self.group_menus:
+            group_menu.deleteLater()
+        self.group_menus = []
         for hotkey in self.hotkey_list:
             keyboard.remove_hotkey(hotkey)
+        self.hotkey_list = []
 
-        # JSON 파일 읽기
-        if not os.path.exists(TIMER_FILE):
-            QMessageBox.warning(self.root, "파일 없음", "TIMER_FILE 파일이 없습니다.")
-            return
-
-        with open(TIMER_FILE, "r", encoding="utf-8") as f:
-            all_data = json.load(f)
+        if all_data is None:
+            # JSON 파일 읽기
+            if not os.path.exists(TIMER_FILE):
+                QMessageBox.warning(self.root, "파일 없음", "TIMER_FILE 파일이 없습니다.")
+                return
+            all_data = load_timers(TIMER_FILE)
 
         for group, timers in sorted(all_data.items()):
             group_menu = QMenu(group, self.action_saved_timer_menu)
@@ -136,12 +202,14 @@ class TrayApp:
                 group_menu.addAction(action)
 
             self.action_saved_timer_menu.addMenu(group_menu)
+            self.group_menus.append(group_menu)
 
     def _rebuild_timer_window_contents(self):
-        for i in reversed(range(self.timer_window.layout().count())):
-            widget = self.timer_window.layout().itemAt(i).widget()
-            if widget:
-                widget.setParent(None)
+        layout = self.timer_window.layout()
+        while layout.count():
+            item = layout.takeAt(0)
+            if item.widget():
+                item.widget().deleteLater()
 
         # 새로 스크롤 + 그리드 구성
         scroll = QScrollArea()
@@ -160,6 +228,7 @@ class TrayApp:
         self.grid = grid
         self.timer_row_counter = 1
         self.timer_labels = {}
+        self.timer_rows = {}
 
         self.timer_window.layout().addWidget(scroll)
 
@@ -168,40 +237,44 @@ class TrayApp:
         self.timer_manager.start_timer(group, title, minutes, seconds)
         self.add_timer_to_window(group, title)
 
+    def _create_alert(self, group, title, mode):
+        # 닫히면 Qt 가 지우고(WA_DeleteOnClose), destroyed 에서 참조를 놓는다
+        alert = FloatingAlert(group, title, mode=mode)
+        self.alerts.add(alert)
+        alert.destroyed.connect(lambda *_, a=alert: self.alerts.discard(a))
+        screen = QApplication.primaryScreen().geometry()
+        x = screen.width() - alert.width() - 20
+        y = screen.height() - alert.height() - 60
+        alert.move(x, y)
+        return alert
+
     def on_timer_finished(self, group_title_tuple):
         group, title = group_title_tuple
-        self.alert = FloatingAlert(group, title, mode="finished")
-        screen = QApplication.primaryScreen().geometry()
-        x = screen.width() - self.alert.width() - 20
-        y = screen.height() - self.alert.height() - 60
-        self.alert.move(x, y)
+        alert = self._create_alert(group, title, "finished")
         try:
             pygame.mixer.music.load(ALERT_SOUND_FILE)
             pygame.mixer.music.set_volume(ALERT_VOLUME)
             pygame.mixer.music.play()
         except Exception as e:
             print(f"[사운드 오류] {e}")
-        self.alert.show()
+        alert.show()
 
     def on_hotkey(self, group, title, minutes, seconds):
         self.hotkey_bridge.hotkey_triggered.emit(group, title, minutes, seconds)
 
     def on_hotkey_triggered(self, group, title, minutes, seconds):
-        self.alert = FloatingAlert(group, title, mode="hotkey_start")
-        screen = QApplication.primaryScreen().geometry()
-        x = screen.width() - self.alert.width() - 20
-        y = screen.height() - self.alert.height() - 60
-        self.alert.move(x, y)
+        alert = self._create_alert(group, title, "hotkey_start")
         self.trigger_timer(group, title, minutes, seconds)
-        self.alert.show()
+        alert.show()
 
     # 타이머 저장 / 알림 추가
     def save_timer(self):
         dialog = TimerInputDialog(self.root)
-        if dialog.exec() != QDialog.DialogCode.Accepted:
-            return
-
+        accepted = dialog.exec() == QDialog.DialogCode.Accepted
         data = dialog.get_data()
+        dialog.deleteLater()
+        if not accepted:
+            return
 
         # 유효성 검사
         if not data["group"]:
@@ -210,50 +283,22 @@ class TrayApp:
         if not data["title"]:
             QMessageBox.warning(self.root, "입력 오류", "제목을 입력하세요.")
             return
-        if not data["minutes"].isdigit() or not data["seconds"].isdigit():
+        if not data["minutes"].isdecimal() or not data["seconds"].isdecimal():
             QMessageBox.warning(self.root, "입력 오류", "분과 초는 숫자여야 합니다.")
             return
-        if data["hotkey"]:
-            try:
-                keyboard.parse_hotkey(data["hotkey"])
-            except Exception as e:
-                QMessageBox.warning(self.root, "입력 오류", "잘못된 핫키 입력입니다.")
-                return
 
         group = data["group"]
         title = data["title"]
-        timers = {}
 
-        if os.path.exists(TIMER_FILE):
-            with open(TIMER_FILE, "r", encoding="utf-8") as f:
-                timers = json.load(f)
-
-        timers = defaultdict(dict, timers)
-        timers[group][data["title"]] = {
-            "minutes": int(data["minutes"]),
-            "seconds": int(data["seconds"]),
-        }
-        if data.get("hotkey"):
-            if data["hotkey"] in self.hotkey_list:
-                QMessageBox.warning(
-                    self.root,
-                    "입력 오류",
-                    f"중복된 핫키 입력입니다: {group}/{title}",
-                )
-                return
-            timers[group][title]["hotkey"] = data["hotkey"]
-
-        sorted_timers = {}
-        for group_key, timer_dict in sorted(timers.items()):
-            sorted_timers[group_key] = {
-                title: config for title, config in sorted(timer_dict.items())
-            }
-        timers = sorted_timers
-
-        with open(TIMER_FILE, "w", encoding="utf-8") as f:
-            json.dump(dict(timers), f, ensure_ascii=False, indent=2)
+        # 핫키 파싱 / 중복 검사는 일괄 가져오기와 같은 경로로 처리
+        try:
+            timers = merge_entries(load_timers(TIMER_FILE), [(f"{group}/{title}", data)])
+        except BulkImportError as e:
+            QMessageBox.warning(self.root, "입력 오류", "\n".join(e.errors))
+            return
 
-        self.build_timer_menu()
+        save_timers(TIMER_FILE, timers)
+        self.build_timer_menu(timers)
 
         QMessageBox.information(
             self.root, "저장 완료", f"'{group} > {title}' 타이머가 저장되었습니다!"
@@ -261,10 +306,11 @@ class TrayApp:
 
     def trigger_alert(self):
         dialog = TimerInputDialog(self.root)
-        if dialog.exec() != QDialog.DialogCode.Accepted:
-            return
-
+        accepted = dialog.exec() == QDialog.DialogCode.Accepted
         data = dialog.get_data()
+        dialog.deleteLater()
+        if not accepted:
+            return
         if data["minutes"] == "":
             data["minutes"] = "0"
         if data["seconds"] == "":
@@ -276,7 +322,7 @@ class TrayApp:
         if not data["title"]:
             QMessageBox.warning(self.root, "입력 오류", "제목을 입력하세요.")
             return
-        if not data["minutes"].isdigit() or not data["seconds"].isdigit():
+        if not data["minutes"].isdecimal() or not data["seconds"].isdecimal():
             QMessageBox.warning(self.root, "입력 오류", "분과 초는 숫자여야 합니다.")
             return
         if data["hotkey"]:
@@ -292,26 +338,22 @@ class TrayApp:
 
         self.trigger_timer(group, title, minutes, seconds)
 
-    def delete_active_timer(self, group, title, row_number):
+    def delete_active_timer(self, group, title):
         # 1. 타이머 정지
         self.timer_manager.stop_timer((group, title))
 
-        # 2. 타이머 창 UI에서 제거
-        label = self.timer_labels.pop((group, title), None)
-        if label:
-            label.deleteLater()
-
-        # 3. 레이아웃에서 나머지 그룹/제목 라벨도 제거
-        for col in range(4):
-            item = self.grid.itemAtPosition(row_number, col)
-            if item and item.widget():
-                item.widget().deleteLater()
+        # 2. 타이머 창 UI에서 행 전체 제거
+        self.timer_labels.pop((group, title), None)
+        for widget in self.timer_rows.pop((group, title), []):
+            if self.grid is not None:
+                self.grid.removeWidget(widget)
+            widget.deleteLater()
 
         print(f"[삭제됨] 실행 중인 타이머: {group} / {title}")
 
     # 쇼윈도
     def show_active_timers(self):
-        if hasattr(self, "timer_window") and self.timer_window is not None:
+        if self.timer_window is not None:
             # 이미 창이 열려 있으면 포커스만 줌
             self.timer_window.activateWindow()
             return
@@ -339,7 +381,8 @@ class TrayApp:
         self.grid.addWidget(QLabel("<b>남은 시간</b>"), 0, 2)
         self.grid.addWidget(QLabel("<b>삭제</b>"), 0, 3)
 
-        self.timer_labels = {}  # (group, title): QLabel 매핑
+        self.timer_labels = {}
+        self.timer_rows = {}
 
         now = QDateTime.currentDateTime()
         self.timer_row_counter = 1
@@ -348,22 +391,11 @@ class TrayApp:
             remaining = now.secsTo(end_time)
             if remaining <= 0:
                 continue
-
-            self.grid.addWidget(QLabel(group), self.timer_row_counter, 0)
-            self.grid.addWidget(QLabel(title), self.timer_row_counter, 1)
-
-            label = QLabel()
-            self.timer_labels[(group, title)] = label
-            self.grid.addWidget(label, self.timer_row_counter, 2)
-            
-            del_btn = QPushButton("🗑")
-            del_btn.setFixedWidth(30)
-            del_btn.clicked.connect(partial(self.delete_active_timer, group, title, self.timer_row_counter))
-            self.grid.addWidget(del_btn, self.timer_row_counter, 3)
-
-            self.timer_row_counter += 1
+            self._add_timer_row(group, title)
 
         if self.timer_row_counter == 1:
+            # 스크롤 영역은 레이아웃에 올라가지 않으므로 직접 지운다
+            scroll.deleteLater()
             outer_layout.addWidget(QLabel("⛔ 현재 실행 중인 타이머가 없습니다."))
         else:
             outer_layout.addWidget(scroll)
@@ -376,37 +408,33 @@ class TrayApp:
         self.timer_window.finished.connect(self._handle_timer_window_closed)
 
         # QTimer로 실시간 갱신 시작
-        self.refresh_timer = QTimer()
-        self.refresh_timer.setInterval(1000)
-        self.refresh_timer.timeout.connect(self.update_timer_window)
         self.refresh_timer.start()
 
     def add_timer_to_window(self, group, title):
         # 타이머 상태창이 떠 있을 때만 처리
-        if not hasattr(self, "timer_window") or self.timer_window is None:
+        if self.timer_window is None:
             return
-        if (
-            not hasattr(self, "grid")
-            or self.grid is None
-            or not self.timer_window.findChild(QGridLayout)
-        ):
+        if self.grid is None or not self.timer_window.findChild(QGridLayout):
             self._rebuild_timer_window_contents()
         if (group, title) in self.timer_labels:
             return  # 이미 표시 중이면 무시
 
+        self._add_timer_row(group, title)
+
+    def _add_timer_row(self, group, title):
         label_group = QLabel(group)
         label_title = QLabel(title)
         label_time = QLabel("계산 중...")
         del_btn = QPushButton("🗑")
         del_btn.setFixedWidth(30)
-        del_btn.clicked.connect(partial(self.delete_active_timer, group, title, self.timer_row_counter))
+        del_btn.clicked.connect(partial(self.delete_active_timer, group, title))
 
-        self.grid.addWidget(label_group, self.timer_row_counter, 0)
-        self.grid.addWidget(label_title, self.timer_row_counter, 1)
-        self.grid.addWidget(label_time, self.timer_row_counter, 2)
-        self.grid.addWidget(del_btn, self.timer_row_counter, 3)
+        row = [label_group, label_title, label_time, del_btn]
+        for col, widget in enumerate(row):
+            self.grid.addWidget(widget, self.timer_row_counter, col)
 
         self.timer_labels[(group, title)] = label_time
+        self.timer_rows[(group, title)] = row
         self.timer_row_counter += 1
 
     def update_timer_window(self):
@@ -425,16 +453,108 @@ class TrayApp:
                 m, s = divmod(remaining, 60)
                 label.setText(f"{m}분 {s}초 남음")
 
+    def update_tray_countdown(self, *_):
+        nearest = self.timer_manager.next_deadline()
+        if nearest is None:
+            self.tray_timer.stop()
+            self._set_tray_state(None, TRAY_TOOLTIP)
+            return
+        if not self.tray_timer.isActive():
+            self.tray_timer.start()
+
+        (group, title), end_time = nearest
+        remaining = max(0, QDateTime.currentDateTime().secsTo(end_time))
+        m, s = divmod(remaining, 60)
+        tooltip = (
+            f"{TRAY_TOOLTIP}\n"
+            f"⏱ {group} / {title}: {m}분 {s}초 남음\n"
+            f"실행 중: {len(self.timer_manager.ends)}개"
+        )
+        self._set_tray_state(countdown_text(remaining), tooltip)
+
+    def _set_tray_state(self, text, tooltip):
+        # 바뀐 부분만 트레이에 반영 (text 가 None 이면 기본 아이콘)
+        old_text, old_tooltip = self.tray_state
+        if text != old_text:
+            self.tray.setIcon(self.icon if text is None else self.tray_atlas.icon(text))
+        if tooltip != old_tooltip:
+            self.tray.setToolTip(tooltip)
+        self.tray_state = (text, tooltip)
+
+    def show_import_dialog(self):
+        path, _ = QFileDialog.getOpenFileName(
+            self.root, "타이머 가져오기", "", "타이머 파일 (*.json *.csv)"
+        )
+        if not path:
+            return
+
+        try:
+            timers = merge_entries(load_timers(TIMER_FILE), read_entries(path))
+        except BulkImportError as e:
+            errors = e.errors
+            detail = "\n".join(errors[:20])
+            if len(errors) > 20:
+                detail += f"\n... 외 {len(errors) - 20}건"
+            QMessageBox.warning(
+                self.root, "가져오기 실패", f"오류 {len(errors)}건:\n{detail}"
+            )
+            return
+        except (OSError, ValueError) as e:
+            QMessageBox.warning(self.root, "가져오기 실패", str(e))
+            return
+
+        # 저장 1회, 메뉴/핫키 갱신 1회
+        save_timers(TIMER_FILE, timers)
+        self.build_timer_menu(timers)
+
+        QMessageBox.information(self.root, "가져오기 완료", f"{path} 에서 가져왔습니다.")
+
+    def show_export_dialog(self):
+        path, _ = QFileDialog.getSaveFileName(
+            self.root, "타이머 내보내기", "timers_export.json", "JSON (*.json);;CSV (*.csv)"
+        )
+        if not path:
+            return
+
+        try:
+            count = export_timers(TIMER_FILE, path)
+        except OSError as e:
+            QMessageBox.warning(self.root, "내보내기 실패", str(e))
+            return
+
+        QMessageBox.information(self.root, "내보내기 완료", f"{count}개 타이머를 저장했습니다.")
+
     def show_delete_dialog(self):
         dialog = TimerDeleteDialog(self)
         dialog.exec()
+        dialog.deleteLater()
         self.build_timer_menu()  # 삭제 후 메뉴 다시 빌드
 
     # 이벤트 핸들러
     def _handle_timer_window_closed(self):
+        self.refresh_timer.stop()
+        self.timer_window.deleteLater()  # 자식 위젯까지 함께 해제
         self.timer_window = None
         self.grid = None
         self.timer_labels = {}
+        self.timer_rows = {}
+
+    def toggle_profiling(self, checked):
+        if checked:
+            self.profiler.start()
+            self.action_profile.setText("🩺 프로파일링 중지")
+            return
+
+        self.action_profile.setText("🩺 프로파일링 시작")
+        try:
+            paths = self.profiler.stop()
+        except OSError as e:
+            QMessageBox.warning(self.root, "프로파일 저장 실패", str(e))
+            return
+        if paths:
+            QMessageBox.information(
+                self.root, "프로파일 저장", "리포트가 저장되었습니다:\n" + "\n".join(paths)
+            )
 
     def on_tray_activated(self, reason):
         if reason == QSystemTrayIcon.ActivationReason.DoubleClick:
@@ -490,21 +610,30 @@ class HotkeyBridge(QObject):
     hotkey_triggered = pyqtSignal(str, str, int, int)
 
 
+_alert_font_family = None
+
+
+def alert_font_family():
+    # 애플리케이션 폰트는 프로세스당 한 번만 등록한다
+    global _alert_font_family
+    if _alert_font_family is None:
+        font_id = QFontDatabase.addApplicationFont(FONT_FILE) if FONT_FILE else -1
+        font_family = QFontDatabase.applicationFontFamilies(font_id) if font_id != -1 else []
+        _alert_font_family = font_family[0] if font_family else "Malgun Gothic"
+    return _alert_font_family
+
+
 class FloatingAlert(QWidget):
     def __init__(self, group, title, mode="finished", parent=None):
         super().__init__(parent)
+        self.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose)
         self.styel_sheet = """
             background-color: white;
             border: 2px solid black;
             border-radius: 4px;
         """
         self.setStyleSheet(self.styel_sheet)
-        font_id = QFontDatabase.addApplicationFont(FONT_FILE)
-        font_family = QFontDatabase.applicationFontFamilies(font_id)
-        if font_family:
-            self.custom_font = font_family[0]
-        else:
-            self.custom_font = "Malgun Gothic"
+        self.custom_font = alert_font_family()
 
         if mode == "finished":
             self.finish_alert(group, title)
@@ -526,7 +655,7 @@ class FloatingAlert(QWidget):
         self.label.setGeometry(10, 10, 200, 60)
         self.label.setStyleSheet("color: black;")
 
-        QTimer.singleShot(3000, self.close)  # 3초 후 자동 닫힘
+        self._start_close_timer(3000)  # 3초 후 자동 닫힘
 
     def finish_alert(self, group, title):
         self.setWindowFlags(
@@ -544,7 +673,14 @@ class FloatingAlert(QWidget):
         self.label.setGeometry(10, 10, 200, 60)
         self.label.setStyleSheet("color: black;")
 
-        QTimer.singleShot(10000, self.close)  # 10초 후 자동 닫힘
+        self._start_close_timer(10000)  # 10초 후 자동 닫힘
+
+    def _start_close_timer(self, msec):
+        # 알림의 자식 QTimer 라서 먼저 닫혀도 함께 정리된다
+        self.close_timer = QTimer(self)
+        self.close_timer.setSingleShot(True)
+        self.close_timer.timeout.connect(self.close)
+        self.close_timer.start(msec)
 
     def mousePressEvent(self, event):
         self.close()  # 클릭하면 창 닫기
@@ -577,10 +713,7 @@ class TimerDeleteDialog(QDialog):
         self._populate_grid()
 
     def _load_timers(self):
-        if not os.path.exists(TIMER_FILE):
-            return {}
-        with open(TIMER_FILE, "r", encoding="utf-8") as f:
-            return json.load(f)
+        return load_timers(TIMER_FILE)
 
     def _populate_grid(self):
         row = 1
@@ -601,15 +734,12 @@ class TimerDeleteDialog(QDialog):
             QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
         )
         if confirm == QMessageBox.StandardButton.Yes:
-            hotkey = self.timers[group][title].get("hotkey", None)
-            if hotkey:
-                self.tray_app.hotkey_list.remove(hotkey)
+            # 핫키 해제는 다이얼로그가 닫힌 뒤 build_timer_menu 에서 처리
             del self.timers[group][title]
             if not self.timers[group]:
                 del self.timers[group]
 
-            with open(TIMER_FILE, "w", encoding="utf-8") as f:
-                json.dump(self.timers, f, ensure_ascii=False, indent=2)
+            save_timers(TIMER_FILE, self.timers)
 
             QMessageBox.information(self, "삭제 완료", f"{group} > {title} 삭제됨")
             self._refresh_ui()
@@ -638,9 +768,51 @@ class TimerDeleteDialog(QDialog):
                 row += 1
 
 
+def run_cli(args):
+    # 실행 중인 트레이는 메뉴/핫키를 다시 읽지 않으므로 가져오기는 막는다.
+    # 가져오는 동안 잠금을 잡아 두어 그 사이 트레이가 뜨지도 않게 한다.
+    instance = None
+    if args.import_path:
+        instance = SingleInstance(LOCK_FILE)
+        if instance.already_running():
+            instance.cleanup()
+            print(
+                "[가져오기 실패] 트레이 타이머가 실행 중입니다. "
+                "트레이 메뉴의 '📥 타이머 가져오기' 를 사용하세요.",
+                file=sys.stderr,
+            )
+            return 1
+
+    try:
+        if args.import_path:
+            _, count = import_timers(TIMER_FILE, args.import_path)
+            print(f"[가져오기] {count}개 항목 -> {TIMER_FILE}")
+        if args.export_path:
+            count = export_timers(TIMER_FILE, args.export_path)
+            print(f"[내보내기] {count}개 타이머 -> {args.export_path}")
+    except BulkImportError as e:
+        print(f"[가져오기 실패] 오류 {len(e.errors)}건", file=sys.stderr)
+        for error in e.errors:
+            print(f"  {error}", file=sys.stderr)
+        return 1
+    except (OSError, ValueError) as e:
+        print(f"[오류] {e}", file=sys.stderr)
+        return 1
+    finally:
+        if instance:
+            instance.cleanup()
+    return 0
+
+
 if __name__ == "__main__":
-    lock_path = os.path.join(os.path.expanduser("~"), ".compact_timer.lock")
-    instance = SingleInstance(lock_path)
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--import", dest="import_path", help="JSON/CSV 타이머 일괄 가져오기")
+    parser.add_argument("--export", dest="export_path", help="JSON/CSV 로 타이머 내보내기")
+    args, _ = parser.parse_known_args()
+    if args.import_path or args.export_path:
+        sys.exit(run_cli(args))
+
+    instance = SingleInstance(LOCK_FILE)
     if instance.already_running():
         sys.exit(0)
     try:
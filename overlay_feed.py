@@ -0,0 +1,214 @@
+"""방송 오버레이용 localhost 카운트다운 피드 (server-sent events).
+
+GET http://127.0.0.1:<feed_port>/events 로 접속하면 아래 JSON 이벤트를 받는다.
+
+    {"type": "snapshot", "timers": [{"group", "title", "end", "remaining"}, ...]}
+    {"type": "started", "group", "title", "end", "remaining"}
+    {"type": "finished" | "stopped", "group", "title"}
+    {"type": "tick", "remaining": [[group, title, 남은 초], ...]}
+
+snapshot 은 접속 직후 한 번만 보내고, 이후에는 바뀐 항목만 보낸다.
+end 는 종료 시각(epoch ms)이다.
+"""
+import json
+import queue
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+KEEPALIVE_SECONDS = 15
+CLIENT_QUEUE_SIZE = 256
+
+
+class _Client:
+    def __init__(self):
+        self.queue = queue.Queue(CLIENT_QUEUE_SIZE)
+        self.closed = False
+
+
+class _FeedHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.path.split("?", 1)[0] != "/events":
+            self.send_error(404)
+            return
+
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream; charset=utf-8")
+        self.send_header("Cache-Control", "no-cache")
+        self.send_header("Access-Control-Allow-Origin", "*")
+        self.end_headers()
+
+        feed = self.server.feed
+        client = feed._connect()
+        try:
+            self.wfile.write(feed._snapshot_message())
+            self.wfile.flush()
+            while not client.closed:
+                try:
+                    data = client.queue.get(timeout=KEEPALIVE_SECONDS)
+                except queue.Empty:
+                    data = b": keep-alive\n\n"
+                self.wfile.write(data)
+                self.wfile.flush()
+        except OSError:
+            pass  # 브라우저 소스가 닫힘
+        finally:
+            feed._disconnect(client)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class OverlayFeed:
+    """TimerManager 이벤트를 SSE 로 내보내는 백그라운드 서버.
+
+    HTTP 처리와 매초 남은 시간 계산은 별도 스레드에서 한다. GUI 스레드에서
+    불리는 시그널 핸들러는 접속한 클라이언트가 없으면 바로 반환한다.
+
+    핸들러는 먼저 잠금 없이 클라이언트 유무만 보고 돌아간다. TimerManager 는
+    ends 를 바꾼 뒤 시그널을 보내므로, 이때 클라이언트가 없었다면 이후 첫
+    클라이언트의 시드에 그 변경이 이미 들어 있다. 상태 갱신은 _lock 안에서
+    클라이언트 유무를 다시 확인한 뒤에만 한다.
+    """
+
+    def __init__(self, timer_manager, port, host="127.0.0.1"):
+        self.timer_manager = timer_manager
+        self._server = ThreadingHTTPServer((host, port), _FeedHandler)
+        self._server.daemon_threads = True
+        self._server.feed = self
+
+        self._lock = threading.Lock()
+        self._clients = set()
+        self._deadlines = {}  # (group, title): 종료 epoch ms (클라이언트가 있을 때만 유지)
+        self._last_sent = {}  # (group, title): 마지막으로 보낸 남은 초
+        self._has_clients = threading.Event()
+        self._stopped = threading.Event()
+
+        timer_manager.timer_started.connect(self._on_started)
+        timer_manager.timer_finished.connect(self._on_finished)
+        timer_manager.timer_stopped.connect(self._on_stopped)
+
+    @property
+    def port(self):
+        return self._server.server_address[1]
+
+    def start(self):
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+        threading.Thread(target=self._tick_loop, daemon=True).start()
+
+    def stop(self):
+        self._stopped.set()
+        self._has_clients.set()  # 대기 중인 틱 스레드 깨우기
+        self._server.shutdown()
+        self._server.server_close()
+        with self._lock:
+            for client in self._clients:
+                client.closed = True
+
+    # GUI 스레드 (TimerManager 시그널)
+    def _on_started(self, name):
+        if not self._clients:
+            return
+        end_time = self.timer_manager.ends.get(name)
+        if end_time is None:
+            return
+        end_msecs = end_time.toMSecsSinceEpoch()
+        remaining = self._remaining(end_msecs)
+        with self._lock:
+            if not self._clients:
+                return
+            self._deadlines[name] = end_msecs
+            self._last_sent[name] = remaining
+        self._broadcast(
+            {
+                "type": "started",
+                "group": name[0],
+                "title": name[1],
+                "end": end_msecs,
+                "remaining": remaining,
+            }
+        )
+
+    def _on_finished(self, name):
+        self._on_removed(name, "finished")
+
+    def _on_stopped(self, name):
+        self._on_removed(name, "stopped")
+
+    def _on_removed(self, name, event_type):
+        if not self._clients:
+            return
+        with self._lock:
+            if not self._clients:
+                return
+            self._deadlines.pop(name, None)
+            self._last_sent.pop(name, None)
+        self._broadcast({"type": event_type, "group": name[0], "title": name[1]})
+
+    # 피드 스레드
+    def _connect(self):
+        client = _Client()
+        with self._lock:
+            if not self._clients:
+                # 클라이언트가 없는 동안은 상태를 들고 있지 않으므로 새로 읽어 온다.
+                # 시드와 등록을 한 번에 해야 GUI 스레드 핸들러가 그 사이에 끼지 않는다
+                ends = list(self.timer_manager.ends.items())
+                self._deadlines = {name: end.toMSecsSinceEpoch() for name, end in ends}
+                self._last_sent = {}
+            self._clients.add(client)
+        self._has_clients.set()
+        return client
+
+    def _disconnect(self, client):
+        client.closed = True
+        with self._lock:
+            self._clients.discard(client)
+            if not self._clients:
+                self._has_clients.clear()
+                self._deadlines = {}
+                self._last_sent = {}
+
+    def _snapshot_message(self):
+        with self._lock:
+            timers = []
+            for name, end_msecs in self._deadlines.items():
+                remaining = self._last_sent.setdefault(name, self._remaining(end_msecs))
+                timers.append(
+                    {"group": name[0], "title": name[1], "end": end_msecs, "remaining": remaining}
+                )
+        return self._encode({"type": "snapshot", "timers": timers})
+
+    def _tick_loop(self):
+        while not self._stopped.is_set():
+            self._has_clients.wait()
+            # 다음 초 경계까지 대기
+            if self._stopped.wait(1 - (time.time() % 1)):
+                return
+
+            changed = []
+            with self._lock:
+                for name, end_msecs in self._deadlines.items():
+                    remaining = self._remaining(end_msecs)
+                    if self._last_sent.get(name) != remaining:
+                        self._last_sent[name] = remaining
+                        changed.append([name[0], name[1], remaining])
+            if changed:
+                self._broadcast({"type": "tick", "remaining": changed})
+
+    def _broadcast(self, event):
+        data = self._encode(event)
+        with self._lock:
+            clients = list(self._clients)
+        for client in clients:
+            try:
+                client.queue.put_nowait(data)
+            except queue.Full:
+                client.closed = True  # 너무 느린 클라이언트는 끊는다
+
+    @staticmethod
+    def _remaining(end_msecs):
+        return max(0, int(end_msecs - time.time() * 1000) // 1000)
+
+    @staticmethod
+    def _encode(event):
+        return f"data: {json.dumps(event, ensure_ascii=False)}\n\n".encode("utf-8")
@@ -0,0 +1,107 @@
+import cProfile
+import io
+import os
+import pstats
+import tracemalloc
+from datetime import datetime
+
+
+class SessionProfiler:
+    """트레이에서 켜고 끄는 CPU / 메모리 프로파일러.
+
+    cProfile 은 enable() 을 호출한 스레드(GUI 스레드)만 측정하므로
+    TimerManager 틱, 메뉴 빌드, FloatingAlert 생성, JSON 입출력이 모두 포함된다.
+    """
+
+    def __init__(self, report_dir, top=40):
+        self.report_dir = report_dir
+        self.top = top
+        self.profile = None
+        self.start_snapshot = None
+        self.started_at = None
+        self._own_tracemalloc = False
+
+    @property
+    def running(self):
+        return self.profile is not None
+
+    def start(self):
+        if self.running:
+            return
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(10)
+            self._own_tracemalloc = True
+        self.start_snapshot = tracemalloc.take_snapshot()
+        self.started_at = datetime.now()
+        self.profile = cProfile.Profile()
+        self.profile.enable()
+
+    def stop(self):
+        """프로파일링을 멈추고 리포트 파일 경로 목록을 반환한다.
+
+        리포트를 쓰지 못하면 OSError 를 그대로 올리지만, 세션은 항상 끝난 상태가 된다.
+        """
+        if not self.running:
+            return []
+        self.profile.disable()
+        end_snapshot = tracemalloc.take_snapshot()
+        traced = tracemalloc.get_traced_memory()
+        if self._own_tracemalloc:
+            tracemalloc.stop()
+            self._own_tracemalloc = False
+
+        try:
+            os.makedirs(self.report_dir, exist_ok=True)
+            # 같은 초에 두 번 멈춰도 덮어쓰지 않도록 마이크로초까지 넣는다
+            stamp = self.started_at.strftime("%Y%m%d_%H%M%S_%f")
+            base = os.path.join(self.report_dir, f"profile_{stamp}")
+
+            return [
+                self._write_cpu_report(base),
+                self._write_memory_report(base, end_snapshot, traced),
+            ]
+        finally:
+            self.profile = None
+            self.start_snapshot = None
+            self.started_at = None
+
+    def _write_cpu_report(self, base):
+        # .prof 원본은 snakeviz 등으로 비교용, .txt 는 바로 읽기용
+        self.profile.dump_stats(base + ".prof")
+
+        buf = io.StringIO()
+        stats = pstats.Stats(self.profile, stream=buf)
+        stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(self.top)
+        stats.sort_stats(pstats.SortKey.TIME).print_stats(self.top)
+
+        path = base + "_cpu.txt"
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(f"시작: {self.started_at.isoformat(timespec='seconds')}\n")
+            f.write(f"종료: {datetime.now().isoformat(timespec='seconds')}\n\n")
+            f.write(buf.getvalue())
+        return path
+
+    def _write_memory_report(self, base, end_snapshot, traced):
+        filters = [
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+        ]
+        start = self.start_snapshot.filter_traces(filters)
+        end = end_snapshot.filter_traces(filters)
+
+        current, peak = traced
+        total = sum(stat.size for stat in end.statistics("filename"))
+
+        path = base + "_mem.txt"
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(f"추적된 메모리: {total / 1024:.1f} KiB\n")
+            f.write(f"현재/최대: {current / 1024:.1f} / {peak / 1024:.1f} KiB\n")
+
+            f.write(f"\n[증가량 상위 {self.top}]\n")
+            for stat in end.compare_to(start, "lineno")[: self.top]:
+                f.write(f"{stat}\n")
+
+            f.write(f"\n[할당량 상위 {self.top}]\n")
+            for stat in end.statistics("lineno")[: self.top]:
+                f.write(f"{stat}\n")
+        return path
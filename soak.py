@@ -0,0 +1,147 @@
+"""오프스크린 소크(soak) 점검 스크립트.
+
+타이머 시작/종료, 알림 생성, 타이머 창 열기/닫기, 메뉴 재구성을 수천 번 반복한 뒤
+Python 객체 수, Qt 객체 수, RSS 증가량이 예산을 넘으면 종료 코드 1 로 끝난다.
+
+    python soak.py --cycles 3000
+"""
+import argparse
+import gc
+import json
+import os
+import sys
+import tempfile
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+os.chdir(os.path.dirname(os.path.abspath(__file__)))  # conf.json 기준 경로
+
+from PyQt6.QtCore import QObject, QTimer
+from PyQt6.QtWidgets import QApplication
+
+import main
+
+
+def rss_kib():
+    try:
+        with open("/proc/self/statm", "r") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") // 1024
+    except (OSError, ValueError, AttributeError):
+        pass
+    try:
+        import resource
+
+        # 최대 RSS 라 줄어들지는 않지만 증가량 예산 확인에는 충분하다
+        usage = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return usage // 1024 if sys.platform == "darwin" else usage
+    except ImportError:
+        return None
+
+
+def qt_object_count(tray_app):
+    return (
+        len(QApplication.allWidgets())
+        + len(tray_app.root.findChildren(QObject))
+        + len(tray_app.timer_manager.findChildren(QObject))
+    )
+
+
+def measure(tray_app):
+    gc.collect()
+    return {
+        "py": len(gc.get_objects()),
+        "qt": qt_object_count(tray_app),
+        "rss": rss_kib(),
+    }
+
+
+def run_cycle(tray_app, i):
+    group = "soak"
+    title = f"timer{i % 50}"
+
+    tray_app.trigger_timer(group, title, 0, 30)
+    tray_app.on_hotkey_triggered(group, "hotkey", 0, 30)
+
+    tray_app.show_active_timers()
+    tray_app.trigger_timer(group, "extra", 0, 30)  # 창이 열린 상태에서 행 추가
+    tray_app.delete_active_timer(group, title)
+    tray_app.timer_manager._complete((group, "hotkey"))
+    tray_app.timer_manager._complete((group, "extra"))
+    tray_app.timer_window.reject()
+
+    for alert in list(tray_app.alerts):
+        alert.close()
+
+    if i % 10 == 0:
+        tray_app.build_timer_menu()
+
+
+def main_soak():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--cycles", type=int, default=3000)
+    parser.add_argument("--warmup", type=int, default=200)
+    parser.add_argument("--max-py-growth", type=int, default=5000)
+    parser.add_argument("--max-qt-growth", type=int, default=50)
+    parser.add_argument("--max-rss-growth-mib", type=float, default=32)
+    args = parser.parse_args()
+
+    timer_file = tempfile.NamedTemporaryFile(
+        "w", suffix=".json", delete=False, encoding="utf-8"
+    )
+    json.dump({"soak": {"menu": {"minutes": 1, "seconds": 0}}}, timer_file)
+    timer_file.close()
+    main.TIMER_FILE = timer_file.name
+
+    tray_app = main.TrayApp()
+    state = {"i": 0, "baseline": None, "exit": 1}
+
+    # 매 사이클마다 이벤트 루프로 돌아가야 deleteLater 가 실제로 처리된다
+    def step():
+        i = state["i"]
+        if i == args.warmup:
+            state["baseline"] = measure(tray_app)
+        if i >= args.warmup + args.cycles:
+            driver.stop()
+            state["exit"] = report(state["baseline"], measure(tray_app), args)
+            tray_app.app.exit(state["exit"])
+            return
+        run_cycle(tray_app, i)
+        state["i"] += 1
+
+    driver = QTimer()
+    driver.setInterval(0)
+    driver.timeout.connect(step)
+    driver.start()
+
+    try:
+        tray_app.run()
+    finally:
+        os.remove(timer_file.name)
+    return state["exit"]
+
+
+def report(before, after, args):
+    failed = False
+    budgets = [
+        ("Python 객체", "py", args.max_py_growth, ""),
+        ("Qt 객체", "qt", args.max_qt_growth, ""),
+        ("RSS", "rss", args.max_rss_growth_mib * 1024, " KiB"),
+    ]
+    print(f"[소크] {args.cycles} 사이클 (워밍업 {args.warmup})")
+    for name, key, budget, unit in budgets:
+        if before[key] is None or after[key] is None:
+            print(f"  {name}: 측정 불가")
+            continue
+        growth = after[key] - before[key]
+        over = growth > budget
+        failed = failed or over
+        mark = "초과" if over else "OK"
+        print(
+            f"  {name}: {before[key]}{unit} -> {after[key]}{unit} "
+            f"(+{growth}{unit}, 예산 {budget:g}{unit}) {mark}"
+        )
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main_soak())
@@ -0,0 +1,59 @@
+import pytest
+
+import timer_store
+from timer_store import BulkImportError, merge_entries
+
+
+def _parse_hotkey(hotkey):
+    # keyboard.parse_hotkey 대신: 키 이름을 그대로 스캔 코드처럼 쓴다
+    if not hotkey or hotkey.endswith("+"):
+        raise ValueError(hotkey)
+    return (tuple((name,) for name in hotkey.split("+")),)
+
+
+@pytest.fixture(autouse=True)
+def fake_parser(monkeypatch):
+    monkeypatch.setattr(timer_store.keyboard, "parse_hotkey", _parse_hotkey)
+
+
+def _row(group, title, hotkey=""):
+    return f"{group}/{title}", {
+        "group": group,
+        "title": title,
+        "minutes": "1",
+        "seconds": "0",
+        "hotkey": hotkey,
+    }
+
+
+def test_existing_normalized_duplicate_does_not_block_import():
+    existing = {
+        "a": {
+            "x": {"minutes": 1, "seconds": 0, "hotkey": "ctrl+alt+1"},
+            "y": {"minutes": 1, "seconds": 0, "hotkey": "alt+ctrl+1"},
+        }
+    }
+    merged = merge_entries(existing, [_row("b", "z", "ctrl+2")])
+    assert merged["b"]["z"]["hotkey"] == "ctrl+2"
+    assert merged["a"] == existing["a"]
+
+
+def test_imported_row_clashing_with_existing_is_reported():
+    existing = {"a": {"x": {"minutes": 1, "seconds": 0, "hotkey": "ctrl+alt+1"}}}
+    with pytest.raises(BulkImportError) as e:
+        merge_entries(existing, [_row("b", "z", "alt+ctrl+1")])
+    assert e.value.errors == ["b/z: 중복된 핫키 입력입니다: alt+ctrl+1 (a/x)"]
+
+
+def test_batch_can_swap_hotkeys_with_existing_entry():
+    existing = {"G": {"B": {"minutes": 1, "seconds": 0, "hotkey": "ctrl+1"}}}
+    merged = merge_entries(existing, [_row("G", "A", "ctrl+1"), _row("G", "B", "ctrl+2")])
+    assert merged["G"]["A"]["hotkey"] == "ctrl+1"
+    assert merged["G"]["B"]["hotkey"] == "ctrl+2"
+
+
+def test_non_decimal_digits_are_reported_not_raised():
+    row = dict(_row("a", "x")[1], minutes="²")
+    with pytest.raises(BulkImportError) as e:
+        merge_entries({}, [("a/x", row)])
+    assert e.value.errors == ["a/x: 분과 초는 0 이상의 숫자여야 합니다."]
@@ -1,29 +1,63 @@
+import heapq
+from itertools import count
+
 from PyQt6.QtCore import QTimer, QDateTime, QObject, pyqtSignal
 
 class TimerManager(QObject):
     # 타이머 종료 시 (이름, 메시지, 남은 초)
     timer_finished = pyqtSignal(tuple)
     timer_updated = pyqtSignal(tuple, int)  # (이름, 남은 초)
+    timer_started = pyqtSignal(tuple)
+    timer_stopped = pyqtSignal(tuple)  # 사용자가 중간에 멈춘 경우
 
     def __init__(self, parent=None):
         super().__init__(parent)
         self.timers = {}  # name: QTimer
         self.ends = {}  # name: QDateTime
+        # (종료 ms, 순번, name) 최소 힙. 중지된 항목은 peek 할 때 걸러낸다
+        self._deadlines = []
+        self._seq = count()
 
     def start_timer(self, group, title, minutes, seconds):
         total_seconds = int(minutes) * 60 + int(seconds)
         if total_seconds <= 0:
             return
 
-        self.stop_timer((group, title))
+        self._discard((group, title))
 
         timer = QTimer(self)
         timer.setInterval(1000)
         timer.timeout.connect(lambda n=(group, title): self._tick(n))
         timer.start()
 
+        end_time = QDateTime.currentDateTime().addSecs(total_seconds)
         self.timers[(group, title)] = timer
-        self.ends[(group, title)] = QDateTime.currentDateTime().addSecs(total_seconds)
+        self.ends[(group, title)] = end_time
+        heapq.heappush(
+            self._deadlines,
+            (end_time.toMSecsSinceEpoch(), next(self._seq), (group, title)),
+        )
+        if len(self._deadlines) > 2 * len(self.ends) + 16:
+            self._compact_deadlines()
+        self.timer_started.emit((group, title))
+
+    def next_deadline(self):
+        """가장 먼저 끝나는 (name, 종료 QDateTime) 을 반환한다. 없으면 None."""
+        while self._deadlines:
+            end_msecs, _, name = self._deadlines[0]
+            end_time = self.ends.get(name)
+            if end_time is not None and end_time.toMSecsSinceEpoch() == end_msecs:
+                return name, end_time
+            heapq.heappop(self._deadlines)
+        return None
+
+    def _compact_deadlines(self):
+        # 재시작이 잦으면 중지된 항목이 힙에 쌓이므로 가끔 새로 만든다
+        self._deadlines = [
+            (end_time.toMSecsSinceEpoch(), next(self._seq), name)
+            for name, end_time in self.ends.items()
+        ]
+        heapq.heapify(self._deadlines)
 
     def _tick(self, group_title_tuple):
         group, title = group_title_tuple
@@ -41,14 +75,22 @@ class TimerManager(QObject):
 
     def _complete(self, group_title_tuple):
         group, title = group_title_tuple
-        self.stop_timer((group, title))
+        self._discard((group, title))
         self.timer_finished.emit((group, title))
 
     def stop_timer(self, group_title_tuple):
+        if self._discard(group_title_tuple):
+            self.timer_stopped.emit(group_title_tuple)
+
+    def _discard(self, group_title_tuple):
         group, title = group_title_tuple
+        found = (group, title) in self.ends
         if (group, title) in self.timers:
             self.timers[(group, title)].stop()
             self.timers[(group, title)].deleteLater()
             del self.timers[(group, title)]
         if (group, title) in self.ends:
             del self.ends[(group, title)]
+        if not self.ends:
+            self._deadlines.clear()
+        return found
@@ -0,0 +1,236 @@
+import csv
+import json
+import os
+
+import keyboard
+
+CSV_FIELDS = ["group", "title", "minutes", "seconds", "hotkey"]
+REQUIRED_CSV_FIELDS = ["group", "title", "minutes", "seconds"]
+
+
+def load_timers(path):
+    if not os.path.exists(path):
+        return {}
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def sort_timers(timers):
+    return {
+        group: {title: config for title, config in sorted(timer_dict.items())}
+        for group, timer_dict in sorted(timers.items())
+    }
+
+
+def save_timers(path, timers):
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(sort_timers(timers), f, ensure_ascii=False, indent=2)
+
+
+def iter_entries(timers):
+    for group, timer_dict in timers.items():
+        for title, config in timer_dict.items():
+            yield group, title, config
+
+
+class HotkeyIndex:
+    """핫키 -> (그룹, 제목) 해시 인덱스.
+
+    "ctrl+alt+1" 과 "alt+ctrl+1" 처럼 표기만 다른 핫키도 같은 키로 잡히도록
+    keyboard.parse_hotkey 결과를 정규화해서 키로 쓴다. 파싱 결과는 캐시한다.
+    """
+
+    def __init__(self):
+        self.owners = {}
+        self._parsed = {}
+
+    def normalize(self, hotkey):
+        """정규화된 키를 반환한다. 잘못된 핫키면 ValueError."""
+        if hotkey not in self._parsed:
+            try:
+                steps = keyboard.parse_hotkey(hotkey)
+            except Exception as e:
+                raise ValueError(f"잘못된 핫키 입력입니다: {hotkey}") from e
+            self._parsed[hotkey] = tuple(tuple(sorted(step)) for step in steps)
+        return self._parsed[hotkey]
+
+    def owner(self, hotkey):
+        return self.owners.get(self.normalize(hotkey))
+
+    def add(self, hotkey, owner):
+        self.owners[self.normalize(hotkey)] = owner
+
+
+class BulkImportError(Exception):
+    """검증 실패 목록을 한꺼번에 담는 예외."""
+
+    def __init__(self, errors):
+        super().__init__("\n".join(errors))
+        self.errors = errors
+
+
+def _read_csv(path):
+    name = os.path.basename(path)
+    with open(path, "r", encoding="utf-8-sig", newline="") as f:
+        reader = csv.DictReader(f)
+        fieldnames = reader.fieldnames or []
+        missing = [field for field in REQUIRED_CSV_FIELDS if field not in fieldnames]
+        if missing:
+            yield name, {"_error": f"필수 열이 없습니다: {', '.join(missing)}"}
+            return
+        for line_no, row in enumerate(reader, start=2):
+            yield f"{name}:{line_no}", row
+
+
+def _read_json(path):
+    with open(path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    # timers.json 과 같은 {그룹: {제목: 설정}} 형식
+    if not isinstance(data, dict):
+        yield os.path.basename(path), {"_error": "최상위는 {그룹: {제목: 설정}} 형식이어야 합니다."}
+        return
+    for group, timer_dict in data.items():
+        if not isinstance(timer_dict, dict):
+            yield group, {"_error": "그룹 값은 {제목: 설정} 형식이어야 합니다."}
+            continue
+        for title, config in timer_dict.items():
+            if not isinstance(config, dict):
+                yield f"{group}/{title}", {"_error": "설정 값은 객체여야 합니다."}
+                continue
+            yield f"{group}/{title}", dict(config, group=group, title=title)
+
+
+def read_entries(path):
+    """(위치, 행) 목록을 반환한다. 파일 형식이 깨졌으면 ValueError."""
+    if path.lower().endswith(".csv"):
+        try:
+            return list(_read_csv(path))
+        except csv.Error as e:
+            # csv.Error 는 ValueError 가 아니라서 호출하는 쪽에서 놓치기 쉽다
+            raise ValueError(f"{os.path.basename(path)}: CSV 형식 오류: {e}") from e
+    return list(_read_json(path))
+
+
+def _to_int(value):
+    if isinstance(value, int) and not isinstance(value, bool):
+        return value if value >= 0 else None
+    text = str(value if value is not None else "").strip()
+    return int(text) if text.isdecimal() else None
+
+
+def merge_entries(existing, entries):
+    """entries 를 existing 에 합친 새 dict 를 반환한다.
+
+    모든 항목을 한 번에 검증하고, 하나라도 실패하면 오류 전체를 담은
+    BulkImportError 를 던진다. existing 은 변경하지 않는다.
+
+    핫키 중복은 합친 최종 결과를 기준으로 검사하므로, 같은 배치 안에서
+    핫키를 서로 바꾸는 경우처럼 행 순서에 따라 결과가 달라지지 않는다.
+    """
+    merged = {group: dict(timer_dict) for group, timer_dict in existing.items()}
+    seen = {}  # (그룹, 제목): 가져오기 위치
+    errors = []
+
+    for where, row in entries:
+        if row.get("_error"):
+            errors.append(f"{where}: {row['_error']}")
+            continue
+
+        group = str(row.get("group") or "").strip()
+        title = str(row.get("title") or "").strip()
+        hotkey = str(row.get("hotkey") or "").strip()
+        minutes = _to_int(row.get("minutes"))
+        seconds = _to_int(row.get("seconds"))
+
+        if not group:
+            errors.append(f"{where}: 그룹이 없습니다.")
+            continue
+        if not title:
+            errors.append(f"{where}: 제목이 없습니다.")
+            continue
+        if minutes is None or seconds is None:
+            errors.append(f"{where}: 분과 초는 0 이상의 숫자여야 합니다.")
+            continue
+        if minutes * 60 + seconds <= 0:
+            errors.append(f"{where}: 0초 타이머는 실행할 수 없습니다.")
+            continue
+        if (group, title) in seen:
+            errors.append(f"{where}: {seen[(group, title)]} 와 같은 타이머입니다.")
+            continue
+        seen[(group, title)] = where
+
+        # 같은 타이머를 덮어쓰면 기존 설정(핫키 포함)은 통째로 바뀐다
+        config = {"minutes": minutes, "seconds": seconds}
+        if hotkey:
+            config["hotkey"] = hotkey
+        merged.setdefault(group, {})[title] = config
+
+    # 2단계: 최종 결과 전체로 핫키 인덱스를 만든다.
+    # 기존 항목을 먼저 넣어서 충돌은 가져오는 행 쪽에 보고되게 한다.
+    # 기존 항목끼리의 충돌(예전에는 문자열로만 비교해서 저장될 수 있었음)은
+    # 이번 가져오기와 무관하므로 오류로 보지 않는다.
+    index = HotkeyIndex()
+    owners = [
+        (group, title, config)
+        for group, title, config in iter_entries(merged)
+        if (group, title) not in seen
+    ]
+    owners += [(group, title, merged[group][title]) for group, title in seen]
+
+    for group, title, config in owners:
+        hotkey = config.get("hotkey")
+        if not hotkey:
+            continue
+        where = seen.get((group, title))
+        try:
+            owner = index.owner(hotkey)
+        except ValueError as e:
+            if where is not None:
+                errors.append(f"{where}: {e}")
+            continue  # 기존 항목의 잘못된 핫키는 가져오기 오류로 보지 않는다
+        if owner is not None:
+            if where is not None:
+                errors.append(
+                    f"{where}: 중복된 핫키 입력입니다: {hotkey} ({owner[0]}/{owner[1]})"
+                )
+            continue
+        index.add(hotkey, (group, title))
+
+    if errors:
+        raise BulkImportError(errors)
+    return sort_timers(merged)
+
+
+def import_timers(store_path, import_path):
+    """import_path 의 타이머를 검증해 store_path 에 한 번에 저장한다.
+
+    저장된 전체 타이머와 추가/갱신된 개수를 반환한다.
+    """
+    entries = read_entries(import_path)
+    merged = merge_entries(load_timers(store_path), entries)
+    save_timers(store_path, merged)
+    return merged, len(entries)
+
+
+def export_timers(store_path, export_path):
+    timers = load_timers(store_path)
+    if not export_path.lower().endswith(".csv"):
+        save_timers(export_path, timers)
+        return sum(len(t) for t in timers.values())
+
+    count = 0
+    with open(export_path, "w", encoding="utf-8-sig", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=CSV_FIELDS)
+        writer.writeheader()
+        for group, title, config in iter_entries(sort_timers(timers)):
+            writer.writerow(
+                {
+                    "group": group,
+                    "title": title,
+                    "minutes": config["minutes"],
+                    "seconds": config["seconds"],
+                    "hotkey": config.get("hotkey", ""),
+                }
+            )
+            count += 1
+    return count
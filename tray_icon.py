@@ -0,0 +1,83 @@
+from PyQt6.QtCore import Qt
+from PyQt6.QtGui import QColor, QFont, QFontMetrics, QIcon, QPainter, QPixmap
+
+GLYPHS = "0123456789hms"
+
+
+def countdown_text(remaining):
+    """트레이 아이콘에 들어갈 최대 3글자 표기 (45s, 12m, 3h)."""
+    if remaining < 60:
+        return f"{remaining}s"
+    if remaining < 3600:
+        return f"{remaining // 60}m"
+    return f"{min(remaining // 3600, 99)}h"
+
+
+class CountdownIconAtlas:
+    """기본 아이콘 + 글리프 픽스맵을 미리 만들어 두고 조합만 하는 아이콘 생성기.
+
+    글자는 시작할 때 한 번만 렌더링하므로 매초 갱신 시에는 폰트 레이아웃 없이
+    drawPixmap 몇 번으로 끝나고, 같은 표기는 QIcon 캐시에서 바로 꺼낸다.
+    """
+
+    def __init__(self, base_icon, size=32, font_family=""):
+        self.size = size
+        self.glyph_height = size // 2
+
+        self.base = base_icon.pixmap(size, size)
+        if self.base.isNull():
+            self.base = QPixmap(size, size)
+            self.base.fill(Qt.GlobalColor.transparent)
+
+        self.glyphs = self._render_glyphs(font_family)
+        self._cache = {}  # 표기 문자열: QIcon
+
+    def _fit_font(self, font_family):
+        # 가장 넓은 표기(두 자리 + 단위)가 아이콘 폭에 들어갈 때까지 글자를 줄인다.
+        # 배경 띠가 왼쪽으로 1px 더 나가므로 그만큼 여유를 둔다
+        font = QFont(font_family) if font_family else QFont()
+        font.setBold(True)
+        pixel_size = self.glyph_height - 2
+        while True:
+            font.setPixelSize(pixel_size)
+            metrics = QFontMetrics(font)
+            digit = max(metrics.horizontalAdvance(ch) for ch in "0123456789")
+            unit = max(metrics.horizontalAdvance(ch) for ch in "hms")
+            if 2 * digit + unit <= self.size - 1 or pixel_size <= 6:
+                return font, metrics
+            pixel_size -= 1
+
+    def _render_glyphs(self, font_family):
+        font, metrics = self._fit_font(font_family)
+
+        glyphs = {}
+        for ch in GLYPHS:
+            pixmap = QPixmap(metrics.horizontalAdvance(ch), self.glyph_height)
+            pixmap.fill(Qt.GlobalColor.transparent)
+            painter = QPainter(pixmap)
+            painter.setFont(font)
+            painter.setPen(QColor("white"))
+            painter.drawText(pixmap.rect(), Qt.AlignmentFlag.AlignCenter, ch)
+            painter.end()
+            glyphs[ch] = pixmap
+        return glyphs
+
+    def icon(self, text):
+        icon = self._cache.get(text)
+        if icon is None:
+            icon = self._cache[text] = self._compose(text)
+        return icon
+
+    def _compose(self, text):
+        width = sum(self.glyphs[ch].width() for ch in text)
+        x = max(1, self.size - width)
+        y = self.size - self.glyph_height
+
+        pixmap = QPixmap(self.base)
+        painter = QPainter(pixmap)
+        painter.fillRect(x - 1, y, width + 1, self.glyph_height, QColor(0, 0, 0, 200))
+        for ch in text:
+            painter.drawPixmap(x, y, self.glyphs[ch])
+            x += self.glyphs[ch].width()
+        painter.end()
+        return QIcon(pixmap)